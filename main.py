@@ -3,9 +3,19 @@ import logging
 import math
 import time
 import sys
+from dataclasses import dataclass
+from functools import partial
 from enum import Enum, auto
 from typing import Dict, List, Optional, Tuple, Literal, TYPE_CHECKING, cast
 
+# Third party
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # ETS2LA framework
 from ETS2LA.Events import events
 from ETS2LA.Plugin import Author, ETS2LAPlugin, PluginDescription
@@ -30,9 +40,60 @@ LANE_TOLERANCE_FACTOR = 0.75
 LANE_CHANGE_STALL_BUFFER_S = 3.0
 CLEARING_TIMEOUT_S = 30.0
 SPEED_EVENT_HOLD_S = 0.25
+ORIENT_CACHE_SIZE = 4
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+def _scan_lane_loop(
+    longi: np.ndarray,
+    lateral: np.ndarray,
+    valid: np.ndarray,
+    lane_center: float,
+    tolerance: float,
+    front_clearance: float,
+    rear_clearance: float,
+) -> bool:
+    for i in range(longi.shape[0]):
+        if not valid[i]:
+            continue
+
+        if longi[i] > front_clearance or longi[i] < -rear_clearance:
+            continue
+
+        if abs(lateral[i] - lane_center) <= tolerance:
+            return False
+
+    return True
+
+
+def _scan_lane_vectorized(
+    longi: np.ndarray,
+    lateral: np.ndarray,
+    valid: np.ndarray,
+    lane_center: float,
+    tolerance: float,
+    front_clearance: float,
+    rear_clearance: float,
+) -> bool:
+    blocking = (
+        valid
+        & (longi <= front_clearance)
+        & (longi >= -rear_clearance)
+        & (np.abs(lateral - lane_center) <= tolerance)
+    )
+    return not bool(blocking.any())
+
+
+if njit is not None:
+    _scan_lane_clear = njit(cache=True, fastmath=True, boundscheck=False)(
+        _scan_lane_loop
+    )
+else:
+    _scan_lane_clear = _scan_lane_vectorized
+
 
 class OvertakeState(Enum):
     IDLE = auto()
@@ -44,6 +105,74 @@ class OvertakeState(Enum):
     RETURNING = auto()
 
 
+STATE_LABELS = {
+    state: state.name.replace("_", " ").title() for state in OvertakeState
+}
+
+# Bitmasks over OvertakeState values; one "1 << value & mask" test replaces
+# the tuple-membership checks that previously ran every tick.
+ACTIVE_STATE_MASK = sum(
+    1 << state.value for state in OvertakeState if state is not OvertakeState.IDLE
+)
+LEAD_SENSITIVE_MASK = (
+    1 << OvertakeState.MONITORING.value | 1 << OvertakeState.REQUESTING_OUT.value
+)
+
+
+class TrafficView:
+    """Per-tick structure-of-arrays snapshot of the traffic list.
+
+    Packs the five vehicle fields the clearance checks touch into
+    contiguous arrays (plus an id -> index map) so the hot loops never go
+    back through the Vehicle objects.
+    """
+
+    __slots__ = ("xs", "zs", "valid", "id_index", "longi", "lateral")
+
+    def __init__(self, traffic: List[Vehicle]):
+        count = len(traffic)
+        self.xs = np.fromiter((v.position.x for v in traffic), np.float64, count)
+        self.zs = np.fromiter((v.position.z for v in traffic), np.float64, count)
+        self.valid = np.fromiter(
+            (not (v.is_tmp or v.is_trailer) for v in traffic), np.bool_, count
+        )
+        self.id_index = {vehicle.id: i for i, vehicle in enumerate(traffic)}
+        self.longi: Optional[np.ndarray] = None
+        self.lateral: Optional[np.ndarray] = None
+
+    def project(
+        self,
+        truck_x: float,
+        truck_z: float,
+        forward: Tuple[float, float],
+        right: Tuple[float, float],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Rotate all positions into truck space, computed once per tick.
+
+        The view lives for a single tick and truck pose is fixed within it,
+        so every clearance check this tick shares the same arrays.
+        """
+        if self.longi is None:
+            dx = self.xs - truck_x
+            dz = self.zs - truck_z
+            self.longi = dx * forward[0] + dz * forward[1]
+            self.lateral = dx * right[0] + dz * right[1]
+        return self.longi, self.lateral
+
+
+@dataclass
+class TickContext:
+    now: float
+    api: Dict
+    lane_status: str
+    eligible: bool
+    reason: str
+    lead_distance: Optional[float]
+    speed: float
+    speed_limit: float
+    traffic: TrafficView
+
+
 class Plugin(ETS2LAPlugin):
     description = PluginDescription(
         name=_("AutomaticOvertake"),
@@ -68,12 +197,37 @@ class Plugin(ETS2LAPlugin):
 
     def init(self):
         self.controller = cast("Controller", self.modules.SDKController.SCSController())
+        # Bound once so the speed-ramp loop skips the module attribute
+        # lookup on every emit.
+        self._emit_event = events.emit
+        # Pre-bound blinker setters; _trigger_indicator picks the pair by
+        # side instead of resolving attribute names per pulse.
+        self._blinker_set: Dict[Side, partial] = {
+            "left": partial(setattr, self.controller, "lblinker"),
+            "right": partial(setattr, self.controller, "rblinker"),
+        }
         self._initialize_runtime_state()
         self._refresh_side_preferences()
+        self._warm_scan_kernel()
+        self._tick_handlers = {
+            OvertakeState.IDLE: self._tick_idle,
+            OvertakeState.MONITORING: self._tick_monitoring,
+            OvertakeState.REQUESTING_OUT: self._tick_requesting_out,
+            OvertakeState.CHANGING_OUT: self._tick_changing_out,
+            OvertakeState.CLEARING: self._tick_clearing,
+            OvertakeState.REQUESTING_RETURN: self._tick_requesting_return,
+            OvertakeState.RETURNING: self._tick_returning,
+        }
         self._set_phase(OvertakeState.IDLE, "Initialized")
 
+    def _warm_scan_kernel(self):
+        # Trigger numba compilation (or cache load) before the first real
+        # tick so the initial overtake check does not stall on JIT.
+        dummy = np.zeros(1, np.float64)
+        _scan_lane_clear(dummy, dummy, np.zeros(1, np.bool_), 0.0, 1.0, 1.0, 1.0)
+
     def _initialize_runtime_state(self):
-        now = time.time()
+        now = time.monotonic()
 
         self._state = OvertakeState.IDLE
         self._state_since = now
@@ -89,30 +243,130 @@ class Plugin(ETS2LAPlugin):
         self._overtaken_vehicle_id: Optional[int] = None
 
         self._pending_indicator_attr: Optional[str] = None
+        self._pending_indicator_clear: Optional[partial] = None
         self._pending_indicator_release = 0.0
         self._last_indicator_side: Optional[Side] = None
         self._last_indicator_time = 0.0
 
         self._observed_execution = False
         self._last_lane_status = "idle"
+        self._tag_snapshot: Dict[str, object] = {}
+        self._disabled_published = False
+        self._check_key: Optional[Tuple] = None
 
         self._forward_vector: Optional[Tuple[float, float]] = None
         self._right_vector: Optional[Tuple[float, float]] = None
+        self._truck_xz: Tuple[float, float] = (0.0, 0.0)
+        self._orient_cache: Dict[
+            int, Tuple[Tuple[float, float], Tuple[float, float]]
+        ] = {}
 
         self._speed_boost_applied = 0
         self._speed_boost_target = 0
         self._active_speed_event: Optional[SpeedEvent] = None
         self._active_speed_event_started = 0.0
 
+        # Reused every tick by _publish_tags; mutated in place so the 10 Hz
+        # publish does not allocate two fresh dicts per frame.
+        self._status_tag_dict = {"AutomaticOvertake": False}
+        self._state_tag_dict = {
+            "state": OvertakeState.IDLE.name,
+            "reason": "Boot",
+            "targetSide": self._pass_side,
+            "originalSide": self._original_side,
+            "leadVehicleId": None,
+            "overtakenVehicleId": None,
+            "leadDistance": None,
+            "speedKph": None,
+        }
+
         self.state.reset()
         self.state.text = _("Idle")
         self.state.progress = -1
 
     def _refresh_side_preferences(self):
         self._pass_side = "left" if settings.preferred_side == "PassLeft" else "right"
+        self._refresh_settings_snapshot()
+
+    def _refresh_settings_snapshot(self):
+        # Settings go through the framework accessor on every read; snapshot
+        # the hot values into plain floats once per tick instead.
+        self._enabled = settings.enabled
+        self._lane_width = settings.lane_width_m
+        self._lane_tolerance = self._lane_width * LANE_TOLERANCE_FACTOR
+        self._front_clear = settings.lane_clear_front_m
+        self._rear_clear = settings.lane_clear_rear_m
+        self._rear_time_gap = settings.rear_time_gap_s
+        self._min_speed = settings.min_speed_kph
+        self._min_lead_distance = settings.min_lead_distance_m
+        self._min_speed_delta = settings.min_speed_delta_kph
+        self._hold_duration = settings.hold_duration_s
+        self._return_clearance = settings.return_clearance_m
+        self._intersection_buffer = settings.intersection_buffer_m
+        self._request_timeout = settings.request_timeout_s
+        self._speed_boost_kph = settings.overtake_speed_boost_kph
+        self._require_highway = settings.require_highway
+
+        check_key = (
+            self._min_lead_distance,
+            self._min_speed,
+            self._min_speed_delta,
+            self._require_highway,
+            self._intersection_buffer,
+        )
+        if check_key != self._check_key:
+            self._check_key = check_key
+            self._compiled_check = self._build_start_check()
+
+    def _build_start_check(self):
+        # Specialize the eligibility check against the current thresholds;
+        # the closure reads them from cells instead of attributes per tick
+        # and is rebuilt only when a relevant setting changes.
+        min_lead_distance = self._min_lead_distance
+        min_speed = self._min_speed
+        min_speed_delta = self._min_speed_delta
+        require_highway = self._require_highway
+        intersection_buffer = self._intersection_buffer
+
+        def check(
+            speed: float,
+            speed_limit: float,
+            lead_distance: Optional[float],
+            lane_status: str,
+            road_type: str,
+            next_intersection_distance: Optional[float],
+        ) -> Tuple[bool, str]:
+            if lane_status != "idle":
+                return False, "Lane change already active"
+
+            if lead_distance is None or lead_distance <= 0:
+                return False, "No vehicle in front"
+
+            if lead_distance > min_lead_distance:
+                return False, "Lead vehicle too far"
+
+            if speed < min_speed:
+                return False, "Speed below threshold"
+
+            if speed_limit > 0 and speed_limit - speed < min_speed_delta:
+                return False, "Speed delta too small"
+
+            if require_highway and road_type != "highway":
+                return False, "Road not marked as highway"
+
+            if (
+                isinstance(next_intersection_distance, (int, float))
+                and next_intersection_distance > 0
+                and next_intersection_distance < intersection_buffer
+            ):
+                return False, "Intersection too close"
+
+            return True, "Eligible"
+
+        return check
 
     def _update_ui_state(self):
-        label = self._state.name.replace("_", " ").title()
+        label = STATE_LABELS[self._state]
         if self._state_reason:
             self.state.text = f"{label} - {self._state_reason}"
         else:
@@ -120,13 +374,21 @@ class Plugin(ETS2LAPlugin):
         self.state.progress = -1
 
     def _set_phase(
-        self, new_state: OvertakeState, reason: str, *, log_level=logging.INFO
+        self,
+        new_state: OvertakeState,
+        reason: str,
+        *,
+        now: Optional[float] = None,
+        log_level=logging.INFO,
     ):
-        if self._state == new_state and reason == self._state_reason:
+        # Reasons are interned so the per-tick no-change checks here and in
+        # _set_reason reduce to pointer comparisons.
+        reason = sys.intern(reason)
+        if self._state == new_state and reason is self._state_reason:
             return
 
         self._state = new_state
-        self._state_since = time.time()
+        self._state_since = time.monotonic() if now is None else now
         self._state_reason = reason
 
         if self._last_logged_state != (new_state, reason):
@@ -136,14 +398,18 @@ class Plugin(ETS2LAPlugin):
         self._update_ui_state()
 
     def _set_reason(self, reason: str):
-        if self._state_reason == reason:
+        reason = sys.intern(reason)
+        if self._state_reason is reason:
             return
 
         self._state_reason = reason
         self._update_ui_state()
 
-    def _reset_state(self, reason: str):
-        self._set_phase(OvertakeState.IDLE, reason, log_level=logging.INFO)
+    def _reset_state(self, reason: str, now: Optional[float] = None):
+        if now is None:
+            now = time.monotonic()
+
+        self._set_phase(OvertakeState.IDLE, reason, now=now, log_level=logging.INFO)
         self._requested_side = None
         self._lead_vehicle_id = None
         self._overtaken_vehicle_id = None
@@ -151,7 +417,7 @@ class Plugin(ETS2LAPlugin):
         self._observed_execution = False
 
         self._remove_speed_boost()
-        self._update_speed_adjustments(time.time())
+        self._update_speed_adjustments(now)
 
     @events.on("takeover")
     def on_takeover(self, event_object, *args, **kwargs):
@@ -162,40 +428,50 @@ class Plugin(ETS2LAPlugin):
             self._reset_state("Driver takeover")
 
     def _read_tag(self, name: str, default=None):
-        try:
-            value = getattr(self.tags, name, None)
-            if value is None:
-                return default
+        value = getattr(self.tags, name, _MISSING)
+        if value is _MISSING or value is None:
+            return default
 
+        try:
             merged = self.tags.merge(value)
-            return default if merged is None else merged
-
         except (AttributeError, ValueError, TypeError) as error:
-            logger.debug("Failed to read tag '%s': %s", name, error)
-            return default
-        except Exception:
-            logger.exception("Unexpected error reading tag '%s'", name)
+            logger.debug("Failed to merge tag '%s': %s", name, error)
             return default
 
+        return default if merged is None else merged
+
+    def _read_tag_cached(self, name: str, default=None):
+        # Tags cannot change mid-tick; run() clears the snapshot each frame
+        # so every tag pays the merge cost at most once per tick.
+        snapshot = self._tag_snapshot
+        if name in snapshot:
+            return snapshot[name]
+
+        value = self._read_tag(name, default)
+        snapshot[name] = value
+        return value
+
     def _update_indicator_pulse(self, now: float):
         if self._pending_indicator_attr and now >= self._pending_indicator_release:
             try:
-                setattr(self.controller, self._pending_indicator_attr, False)
+                if self._pending_indicator_clear is not None:
+                    self._pending_indicator_clear(False)
             except (AttributeError, TypeError) as error:
                 logger.debug("Failed to release indicator: %s", error)
             except Exception as error:
                 logger.error("Unexpected error releasing indicator: %s", error)
             finally:
                 self._pending_indicator_attr = None
+                self._pending_indicator_clear = None
                 self._pending_indicator_release = 0.0
 
-    def _trigger_indicator(self, side: Side):
-        attr = "lblinker" if side == "left" else "rblinker"
-        opposite = "rblinker" if side == "left" else "lblinker"
+    def _trigger_indicator(self, side: Side, now: float):
+        set_blinker = self._blinker_set[side]
+        set_opposite = self._blinker_set[self._get_opposite_side(side)]
 
         try:
-            setattr(self.controller, opposite, False)
-            setattr(self.controller, attr, True)
+            set_opposite(False)
+            set_blinker(True)
         except (AttributeError, TypeError) as error:
             logger.error("Failed to toggle indicators for %s side: %s", side, error)
             return
@@ -203,61 +479,51 @@ class Plugin(ETS2LAPlugin):
             logger.exception("Unexpected error toggling indicators for %s side", side)
             return
 
-        now = time.time()
-        self._pending_indicator_attr = attr
+        self._pending_indicator_attr = "lblinker" if side == "left" else "rblinker"
+        self._pending_indicator_clear = set_blinker
         self._pending_indicator_release = now + INDICATOR_PULSE_S
         self._last_indicator_side = side
         self._last_indicator_time = now
 
-    def _request_lane_change(self, side: Side):
-        now = time.time()
+    def _request_lane_change(self, side: Side, now: float):
         if (
             self._last_indicator_side == side
             and now - self._last_indicator_time < INDICATOR_COOLDOWN_S
         ):
             return
 
-        self._trigger_indicator(side)
+        self._trigger_indicator(side, now)
 
     def _orientation(
         self, api: Dict
     ) -> Tuple[Tuple[float, float], Tuple[float, float]]:
-        rotation = api["truckPlacement"]["rotationX"] * 360
-        if rotation < 0:
-            rotation += 360
-
-        yaw = math.radians(rotation)
+        # Quantize yaw to 0.1 degree buckets; consecutive 10 Hz ticks rarely
+        # move further than that, so this usually skips the trig entirely.
+        key = int(api["truckPlacement"]["rotationX"] * 3600) % 3600
+        cached = self._orient_cache.get(key)
+        if cached is not None:
+            return cached
+
+        yaw = math.radians(key / 10.0)
         forward = (-math.sin(yaw), -math.cos(yaw))
         right = (math.cos(yaw), -math.sin(yaw))
-        return forward, right
-
-    def _project(self, api: Dict, x: float, z: float) -> Tuple[float, float]:
-        if self._forward_vector and self._right_vector:
-            forward, right = self._forward_vector, self._right_vector
-        else:
-            forward, right = self._orientation(api)
-
-        truck_x = api["truckPlacement"]["coordinateX"]
-        truck_z = api["truckPlacement"]["coordinateZ"]
-
-        dx = x - truck_x
-        dz = z - truck_z
 
-        longitudinal = dx * forward[0] + dz * forward[1]
-        lateral = dx * right[0] + dz * right[1]
-        return longitudinal, lateral
+        if len(self._orient_cache) >= ORIENT_CACHE_SIZE:
+            self._orient_cache.clear()
+        self._orient_cache[key] = (forward, right)
+        return forward, right
 
     def _lane_is_clear(
         self,
         side: Side,
         api: Dict,
-        traffic: List[Vehicle],
+        traffic: TrafficView,
         *,
         front_clearance: float,
         rear_clearance: float,
         use_dynamic_rear: bool = True,
     ) -> bool:
-        if not traffic:
+        if traffic.xs.size == 0:
             return True
 
         if use_dynamic_rear:
@@ -265,25 +531,34 @@ class Plugin(ETS2LAPlugin):
             rear_clearance = self._calculate_safe_rear_clearance(speed_kph)
 
         lane_center = (
-            settings.lane_width_m if side == "right" else -settings.lane_width_m
+            self._lane_width if side == "right" else -self._lane_width
+        )
+        tolerance = self._lane_tolerance
+
+        longi, lateral = self._project_traffic(api, traffic)
+
+        return _scan_lane_clear(
+            longi,
+            lateral,
+            traffic.valid,
+            lane_center,
+            tolerance,
+            front_clearance,
+            rear_clearance,
         )
-        tolerance = settings.lane_width_m * LANE_TOLERANCE_FACTOR
-
-        for vehicle in traffic:
-            if vehicle.is_tmp or vehicle.is_trailer:
-                continue
-
-            longi, lateral = self._project(api, vehicle.position.x, vehicle.position.z)
-
-            if longi > front_clearance or longi < -rear_clearance:
-                continue
-
-            if abs(lateral - lane_center) > tolerance:
-                continue
 
-            return False
+    def _project_traffic(
+        self, api: Dict, traffic: TrafficView
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if self._forward_vector and self._right_vector:
+            forward, right = self._forward_vector, self._right_vector
+            truck_x, truck_z = self._truck_xz
+        else:
+            forward, right = self._orientation(api)
+            truck_x = api["truckPlacement"]["coordinateX"]
+            truck_z = api["truckPlacement"]["coordinateZ"]
 
-        return True
+        return traffic.project(truck_x, truck_z, forward, right)
 
     def _check_start_conditions(
         self,
@@ -295,32 +570,14 @@ class Plugin(ETS2LAPlugin):
         road_type: str,
         next_intersection_distance: Optional[float],
     ) -> Tuple[bool, str]:
-        if lane_status != "idle":
-            return False, "Lane change already active"
-
-        if lead_distance is None or lead_distance <= 0:
-            return False, "No vehicle in front"
-
-        if lead_distance > settings.min_lead_distance_m:
-            return False, "Lead vehicle too far"
-
-        if speed < settings.min_speed_kph:
-            return False, "Speed below threshold"
-
-        if speed_limit > 0 and speed_limit - speed < settings.min_speed_delta_kph:
-            return False, "Speed delta too small"
-
-        if settings.require_highway and road_type != "highway":
-            return False, "Road not marked as highway"
-
-        if (
-            isinstance(next_intersection_distance, (int, float))
-            and next_intersection_distance > 0
-            and next_intersection_distance < settings.intersection_buffer_m
-        ):
-            return False, "Intersection too close"
-
-        return True, "Eligible"
+        return self._compiled_check(
+            speed,
+            speed_limit,
+            lead_distance,
+            lane_status,
+            road_type,
+            next_intersection_distance,
+        )
 
     def _dependencies_ready(self, status: Dict) -> bool:
         if not status:
@@ -336,11 +593,11 @@ class Plugin(ETS2LAPlugin):
 
     def _calculate_safe_rear_clearance(self, speed_kph: float) -> float:
         speed_ms = speed_kph / 3.6
-        dynamic_clearance = speed_ms * settings.rear_time_gap_s
-        return max(settings.lane_clear_rear_m, dynamic_clearance)
+        dynamic_clearance = speed_ms * self._rear_time_gap
+        return max(self._rear_clear, dynamic_clearance)
 
     def _apply_speed_boost(self):
-        boost_amount = int(settings.overtake_speed_boost_kph)
+        boost_amount = int(self._speed_boost_kph)
         if boost_amount <= 0:
             return
 
@@ -370,7 +627,7 @@ class Plugin(ETS2LAPlugin):
 
         event_name = self._active_speed_event
         try:
-            events.emit(event_name, self, False, queue=False)
+            self._emit_event(event_name, self, False, queue=False)
         except Exception as error:
             logger.error("Failed to release %s event: %s", event_name, error)
 
@@ -384,70 +641,216 @@ class Plugin(ETS2LAPlugin):
         self._active_speed_event_started = 0.0
 
     def _update_speed_adjustments(self, now: float):
-        hold_duration = SPEED_EVENT_HOLD_S
-
-        while True:
-            if self._active_speed_event is not None:
-                event_direction = (
-                    1 if self._active_speed_event == "increment_speed" else -1
-                )
-                pending_delta = self._speed_boost_target - self._speed_boost_applied
-                desired_direction = (
-                    1 if pending_delta > 0 else -1 if pending_delta < 0 else 0
-                )
-
-                if desired_direction == 0 or desired_direction != event_direction:
-                    self._finish_speed_adjustment(cancel=True)
-                    continue
-
-                if now - self._active_speed_event_started < hold_duration:
-                    return
-
-                self._finish_speed_adjustment(cancel=False)
-                continue
-
+        if self._active_speed_event is not None:
+            event_direction = (
+                1 if self._active_speed_event == "increment_speed" else -1
+            )
             pending_delta = self._speed_boost_target - self._speed_boost_applied
-            if pending_delta == 0:
-                return
-
-            event_name: SpeedEvent = (
-                "increment_speed" if pending_delta > 0 else "decrement_speed"
+            desired_direction = (
+                1 if pending_delta > 0 else -1 if pending_delta < 0 else 0
             )
 
-            try:
-                events.emit(event_name, self, True, queue=False)
-            except Exception as error:
-                logger.error("Failed to emit %s event: %s", event_name, error)
+            if desired_direction == 0 or desired_direction != event_direction:
+                self._finish_speed_adjustment(cancel=True)
+            elif now - self._active_speed_event_started < SPEED_EVENT_HOLD_S:
                 return
+            else:
+                self._finish_speed_adjustment(cancel=False)
+
+        # No event is active past this point; issue the next step if the
+        # applied boost still trails the target.
+        pending_delta = self._speed_boost_target - self._speed_boost_applied
+        if pending_delta == 0:
+            return
 
-            self._active_speed_event = event_name
-            self._active_speed_event_started = now
+        event_name: SpeedEvent = (
+            "increment_speed" if pending_delta > 0 else "decrement_speed"
+        )
+
+        try:
+            self._emit_event(event_name, self, True, queue=False)
+        except Exception as error:
+            logger.error("Failed to emit %s event: %s", event_name, error)
             return
 
+        self._active_speed_event = event_name
+        self._active_speed_event_started = now
+
     def _is_overtaken_vehicle_clear(
-        self, api: Dict, traffic: List[Vehicle], min_rear_distance: float
+        self, api: Dict, traffic: TrafficView, min_rear_distance: float
     ) -> bool:
         if self._overtaken_vehicle_id is None:
             return True
 
-        overtaken_vehicle = None
-        for vehicle in traffic:
-            if vehicle.id == self._overtaken_vehicle_id:
-                overtaken_vehicle = vehicle
-                break
-
-        if overtaken_vehicle is None:
+        index = traffic.id_index.get(self._overtaken_vehicle_id)
+        if index is None:
             return True
 
-        longi, _ = self._project(
-            api, overtaken_vehicle.position.x, overtaken_vehicle.position.z
-        )
+        tick_longi, _ = self._project_traffic(api, traffic)
+        longi = float(tick_longi[index])
 
         if longi < 0 and abs(longi) > min_rear_distance:
             return True
 
         return False
 
+    def _tick_idle(self, ctx: TickContext):
+        if ctx.eligible:
+            logger.warning(
+                "Overtake initiated: monitoring conditions (lead: %.1f m, speed: %.0f km/h, delta: %.0f km/h)",
+                ctx.lead_distance if ctx.lead_distance is not None else -1.0,
+                ctx.speed,
+                ctx.speed_limit - ctx.speed,
+            )
+            self._set_phase(
+                OvertakeState.MONITORING, "Monitoring conditions", now=ctx.now
+            )
+        else:
+            self._set_reason(ctx.reason)
+
+    def _tick_monitoring(self, ctx: TickContext):
+        if not ctx.eligible:
+            logger.warning("Overtake aborted: %s", ctx.reason)
+            self._reset_state(ctx.reason, ctx.now)
+        elif ctx.now - self._state_since >= self._hold_duration:
+            lane_clear = self._lane_is_clear(
+                self._pass_side,
+                ctx.api,
+                ctx.traffic,
+                front_clearance=self._front_clear,
+                rear_clearance=self._rear_clear,
+            )
+
+            if lane_clear:
+                logger.warning(
+                    "Starting overtake to %s (lead: %.1f m, speed: %.0f km/h)",
+                    self._pass_side,
+                    ctx.lead_distance if ctx.lead_distance is not None else -1.0,
+                    ctx.speed,
+                )
+                self._overtaken_vehicle_id = self._lead_vehicle_id
+                self._original_side = self._get_opposite_side(self._pass_side)
+
+                self._apply_speed_boost()
+                self._update_speed_adjustments(ctx.now)
+
+                self._requested_side = self._pass_side
+                self._request_lane_change(self._pass_side, ctx.now)
+                self._observed_execution = False
+
+                self._set_phase(
+                    OvertakeState.REQUESTING_OUT,
+                    f"Requesting lane change to {self._pass_side}",
+                    now=ctx.now,
+                )
+            else:
+                logger.warning("Overtake aborted: target lane occupied")
+                self._reset_state("Target lane occupied", ctx.now)
+        else:
+            self._set_reason("Verifying stability")
+
+    def _tick_requesting_out(self, ctx: TickContext):
+        if ctx.lane_status.startswith("executing"):
+            self._observed_execution = True
+            self._set_phase(
+                OvertakeState.CHANGING_OUT, "Lane change started", now=ctx.now
+            )
+        elif ctx.now - self._state_since > self._request_timeout:
+            logger.warning("Lane change request timed out")
+            self._reset_state("Lane change did not start", ctx.now)
+        else:
+            self._set_reason("Awaiting lane change start")
+            self._request_lane_change(self._pass_side, ctx.now)
+
+    def _tick_changing_out(self, ctx: TickContext):
+        if ctx.lane_status.startswith("executing"):
+            self._observed_execution = True
+            self._set_reason(f"Executing lane change ({ctx.lane_status})")
+        elif ctx.lane_status == "idle":
+            if self._observed_execution:
+                self._set_phase(
+                    OvertakeState.CLEARING,
+                    "Waiting for overtaken vehicle clearance",
+                    now=ctx.now,
+                )
+            else:
+                logger.warning("Overtake aborted: lane change cancelled by Map")
+                self._reset_state("Lane change cancelled", ctx.now)
+        elif (
+            ctx.now - self._state_since
+            > self._request_timeout + LANE_CHANGE_STALL_BUFFER_S
+        ):
+            logger.warning("Lane change stalled during execution")
+            self._reset_state("Lane change stalled", ctx.now)
+        else:
+            self._set_reason("Waiting for lane change to finish")
+
+    def _tick_clearing(self, ctx: TickContext):
+        is_clear = self._is_overtaken_vehicle_clear(
+            ctx.api, ctx.traffic, self._return_clearance
+        )
+
+        if is_clear:
+            return_lane_clear = self._lane_is_clear(
+                self._original_side,
+                ctx.api,
+                ctx.traffic,
+                front_clearance=self._front_clear,
+                rear_clearance=self._rear_clear,
+            )
+
+            if return_lane_clear:
+                self._requested_side = self._original_side
+                self._request_lane_change(self._original_side, ctx.now)
+                self._observed_execution = False
+                self._set_phase(
+                    OvertakeState.REQUESTING_RETURN,
+                    f"Requesting return to {self._original_side}",
+                    now=ctx.now,
+                )
+            else:
+                self._set_reason("Waiting for original lane to clear")
+        else:
+            self._set_reason("Waiting for overtaken vehicle to clear")
+
+        if ctx.now - self._state_since > CLEARING_TIMEOUT_S:
+            logger.warning("Timeout waiting to return to original lane")
+            self._reset_state("Return timeout", ctx.now)
+
+    def _tick_requesting_return(self, ctx: TickContext):
+        if ctx.lane_status.startswith("executing"):
+            self._observed_execution = True
+            self._set_phase(
+                OvertakeState.RETURNING, "Returning to original lane", now=ctx.now
+            )
+        elif ctx.now - self._state_since > self._request_timeout:
+            logger.warning("Return lane change request timed out")
+            self._reset_state("Return request timeout", ctx.now)
+        else:
+            self._set_reason("Awaiting return lane change start")
+            self._request_lane_change(self._original_side, ctx.now)
+
+    def _tick_returning(self, ctx: TickContext):
+        if ctx.lane_status.startswith("executing"):
+            self._observed_execution = True
+            self._set_reason(f"Executing return ({ctx.lane_status})")
+        elif ctx.lane_status == "idle":
+            if self._observed_execution:
+                logger.warning("Overtake complete")
+                self._remove_speed_boost()
+                self._reset_state("Overtake complete", ctx.now)
+            else:
+                logger.warning("Return lane change cancelled by Map")
+                self._reset_state("Return cancelled", ctx.now)
+        elif (
+            ctx.now - self._state_since
+            > self._request_timeout + LANE_CHANGE_STALL_BUFFER_S
+        ):
+            logger.warning("Return lane change stalled")
+            self._reset_state("Return stalled", ctx.now)
+        else:
+            self._set_reason("Waiting for return to finish")
+
     def _publish_tags(
         self,
         *,
@@ -455,45 +858,68 @@ class Plugin(ETS2LAPlugin):
         lead_distance: Optional[float],
         speed: Optional[float],
     ) -> None:
-        self.tags.status = {"AutomaticOvertake": is_active}
-        self.tags.overtake_state = {
-            "state": self._state.name,
-            "reason": self._state_reason,
-            "targetSide": self._pass_side
-            if self._requested_side is None
-            else self._requested_side,
-            "originalSide": self._original_side,
-            "leadVehicleId": self._lead_vehicle_id,
-            "overtakenVehicleId": self._overtaken_vehicle_id,
-            "leadDistance": lead_distance,
-            "speedKph": speed,
-        }
+        status = self._status_tag_dict
+        status["AutomaticOvertake"] = is_active
+
+        state = self._state_tag_dict
+        state["state"] = self._state.name
+        state["reason"] = self._state_reason
+        state["targetSide"] = (
+            self._pass_side if self._requested_side is None else self._requested_side
+        )
+        state["originalSide"] = self._original_side
+        state["leadVehicleId"] = self._lead_vehicle_id
+        state["overtakenVehicleId"] = self._overtaken_vehicle_id
+        state["leadDistance"] = lead_distance
+        state["speedKph"] = speed
+
+        self.tags.status = status
+        self.tags.overtake_state = state
 
     def run(self):
-        now = time.time()
+        if (
+            self._disabled_published
+            and not settings.enabled
+            and self._state == OvertakeState.IDLE
+            and self._pending_indicator_attr is None
+            and self._active_speed_event is None
+        ):
+            # Disabled and fully quiesced: tags are published, no indicator
+            # pulse or speed event needs releasing, so skip the tick.
+            return
+
+        now = time.monotonic()
 
         self._refresh_side_preferences()
         self._update_indicator_pulse(now)
         self._update_speed_adjustments(now)
 
-        if not settings.enabled:
-            self._reset_state("Disabled")
-            self.tags.status = {"AutomaticOvertake": False}
-            self.tags.overtake_state = {"state": "Disabled", "reason": "Disabled"}
-            self._last_lane_status = "idle"
+        if not self._enabled:
+            # After the first disabled tick everything below is a no-op, so
+            # skip the reset and tag writes until the plugin is re-enabled.
+            if not self._disabled_published or self._state != OvertakeState.IDLE:
+                self._reset_state("Disabled", now)
+                self.tags.status = {"AutomaticOvertake": False}
+                self.tags.overtake_state = {"state": "Disabled", "reason": "Disabled"}
+                self._last_lane_status = "idle"
+                self._disabled_published = True
             return
 
-        status_tag = self._read_tag("status", {})
+        self._disabled_published = False
+
+        self._tag_snapshot.clear()
+
+        status_tag = self._read_tag_cached("status", {})
         if not isinstance(status_tag, dict):
             status_tag = {}
 
-        lane_status = str(self._read_tag("lane_change_status", "idle") or "idle")
-        road_type = str(self._read_tag("road_type", "none") or "none")
-        next_intersection_distance = self._read_tag(
+        lane_status = str(self._read_tag_cached("lane_change_status", "idle") or "idle")
+        road_type = str(self._read_tag_cached("road_type", "none") or "none")
+        next_intersection_distance = self._read_tag_cached(
             "next_intersection_distance", None
         )
-        lead_distance_raw = self._read_tag("vehicle_in_front_distance", None)
-        vehicle_highlights = self._read_tag("vehicle_highlights", [])
+        lead_distance_raw = self._read_tag_cached("vehicle_in_front_distance", None)
+        vehicle_highlights = self._read_tag_cached("vehicle_highlights", [])
 
         lead_distance = (
             float(lead_distance_raw)
@@ -503,7 +929,7 @@ class Plugin(ETS2LAPlugin):
 
         if not self._dependencies_ready(status_tag):
             if self._state != OvertakeState.IDLE:
-                self._reset_state("Waiting for Map/ACC")
+                self._reset_state("Waiting for Map/ACC", now)
             else:
                 self._set_reason("Waiting for Map/ACC")
 
@@ -517,7 +943,7 @@ class Plugin(ETS2LAPlugin):
 
         api = self.modules.TruckSimAPI.run()
         if not isinstance(api, dict):
-            self._reset_state("Telemetry unavailable")
+            self._reset_state("Telemetry unavailable", now)
             self._publish_tags(
                 is_active=False,
                 lead_distance=lead_distance,
@@ -527,11 +953,15 @@ class Plugin(ETS2LAPlugin):
             return
 
         self._forward_vector, self._right_vector = self._orientation(api)
+        self._truck_xz = (
+            api["truckPlacement"]["coordinateX"],
+            api["truckPlacement"]["coordinateZ"],
+        )
 
         speed = api["truckFloat"]["speed"] * 3.6
         speed_limit = api["truckFloat"]["speedLimit"] * 3.6
         if speed_limit == 0:
-            speed_limit = speed + settings.min_speed_delta_kph
+            speed_limit = speed + self._min_speed_delta
 
         previous_lead = self._lead_vehicle_id
         if (
@@ -545,11 +975,10 @@ class Plugin(ETS2LAPlugin):
         if (
             self._lead_vehicle_id is not None
             and self._lead_vehicle_id != previous_lead
-            and self._state
-            in (OvertakeState.MONITORING, OvertakeState.REQUESTING_OUT)
+            and (1 << self._state.value) & LEAD_SENSITIVE_MASK
         ):
             logger.warning("Overtake aborted: lead vehicle changed")
-            self._reset_state("Lead vehicle changed")
+            self._reset_state("Lead vehicle changed", now)
             self._publish_tags(
                 is_active=False,
                 lead_distance=lead_distance,
@@ -572,6 +1001,8 @@ class Plugin(ETS2LAPlugin):
         except Exception as error:
             logger.exception("Failed to retrieve traffic data: %s", error)
 
+        traffic_view = TrafficView(traffic)
+
         eligible, reason = self._check_start_conditions(
             speed=speed,
             speed_limit=speed_limit,
@@ -581,162 +1012,21 @@ class Plugin(ETS2LAPlugin):
             next_intersection_distance=next_intersection_distance,
         )
 
-        if self._state == OvertakeState.IDLE:
-            if eligible:
-                logger.warning(
-                    "Overtake initiated: monitoring conditions (lead: %.1f m, speed: %.0f km/h, delta: %.0f km/h)",
-                    lead_distance if lead_distance is not None else -1.0,
-                    speed,
-                    speed_limit - speed,
-                )
-                self._set_phase(OvertakeState.MONITORING, "Monitoring conditions")
-            else:
-                self._set_reason(reason)
-
-        elif self._state == OvertakeState.MONITORING:
-            if not eligible:
-                logger.warning("Overtake aborted: %s", reason)
-                self._reset_state(reason)
-            elif now - self._state_since >= settings.hold_duration_s:
-                lane_clear = self._lane_is_clear(
-                    self._pass_side,
-                    api,
-                    traffic,
-                    front_clearance=settings.lane_clear_front_m,
-                    rear_clearance=settings.lane_clear_rear_m,
-                )
-
-                if lane_clear:
-                    logger.warning(
-                        "Starting overtake to %s (lead: %.1f m, speed: %.0f km/h)",
-                        self._pass_side,
-                        lead_distance if lead_distance is not None else -1.0,
-                        speed,
-                    )
-                    self._overtaken_vehicle_id = self._lead_vehicle_id
-                    self._original_side = self._get_opposite_side(self._pass_side)
-
-                    self._apply_speed_boost()
-                    self._update_speed_adjustments(now)
-
-                    self._requested_side = self._pass_side
-                    self._request_lane_change(self._pass_side)
-                    self._observed_execution = False
-
-                    self._set_phase(
-                        OvertakeState.REQUESTING_OUT,
-                        f"Requesting lane change to {self._pass_side}",
-                    )
-                else:
-                    logger.warning("Overtake aborted: target lane occupied")
-                    self._reset_state("Target lane occupied")
-            else:
-                self._set_reason("Verifying stability")
-
-        elif self._state == OvertakeState.REQUESTING_OUT:
-            if lane_status.startswith("executing"):
-                self._observed_execution = True
-                self._set_phase(OvertakeState.CHANGING_OUT, "Lane change started")
-            elif now - self._state_since > settings.request_timeout_s:
-                logger.warning("Lane change request timed out")
-                self._reset_state("Lane change did not start")
-            else:
-                self._set_reason("Awaiting lane change start")
-                self._request_lane_change(self._pass_side)
-
-        elif self._state == OvertakeState.CHANGING_OUT:
-            if lane_status.startswith("executing"):
-                self._observed_execution = True
-                self._set_reason(f"Executing lane change ({lane_status})")
-            elif lane_status == "idle":
-                if self._observed_execution:
-                    self._set_phase(
-                        OvertakeState.CLEARING, "Waiting for overtaken vehicle clearance"
-                    )
-                else:
-                    logger.warning("Overtake aborted: lane change cancelled by Map")
-                    self._reset_state("Lane change cancelled")
-            elif (
-                now - self._state_since
-                > settings.request_timeout_s + LANE_CHANGE_STALL_BUFFER_S
-            ):
-                logger.warning("Lane change stalled during execution")
-                self._reset_state("Lane change stalled")
-            else:
-                self._set_reason("Waiting for lane change to finish")
-
-        elif self._state == OvertakeState.CLEARING:
-            is_clear = self._is_overtaken_vehicle_clear(
-                api, traffic, settings.return_clearance_m
-            )
-
-            if is_clear:
-                return_lane_clear = self._lane_is_clear(
-                    self._original_side,
-                    api,
-                    traffic,
-                    front_clearance=settings.lane_clear_front_m,
-                    rear_clearance=settings.lane_clear_rear_m,
-                )
-
-                if return_lane_clear:
-                    self._requested_side = self._original_side
-                    self._request_lane_change(self._original_side)
-                    self._observed_execution = False
-                    self._set_phase(
-                        OvertakeState.REQUESTING_RETURN,
-                        f"Requesting return to {self._original_side}",
-                    )
-                else:
-                    self._set_reason("Waiting for original lane to clear")
-            else:
-                self._set_reason("Waiting for overtaken vehicle to clear")
-
-            if now - self._state_since > CLEARING_TIMEOUT_S:
-                logger.warning("Timeout waiting to return to original lane")
-                self._reset_state("Return timeout")
+        ctx = TickContext(
+            now=now,
+            api=api,
+            lane_status=lane_status,
+            eligible=eligible,
+            reason=reason,
+            lead_distance=lead_distance,
+            speed=speed,
+            speed_limit=speed_limit,
+            traffic=traffic_view,
+        )
+        self._tick_handlers[self._state](ctx)
 
-        elif self._state == OvertakeState.REQUESTING_RETURN:
-            if lane_status.startswith("executing"):
-                self._observed_execution = True
-                self._set_phase(
-                    OvertakeState.RETURNING, "Returning to original lane"
-                )
-            elif now - self._state_since > settings.request_timeout_s:
-                logger.warning("Return lane change request timed out")
-                self._reset_state("Return request timeout")
-            else:
-                self._set_reason("Awaiting return lane change start")
-                self._request_lane_change(self._original_side)
-
-        elif self._state == OvertakeState.RETURNING:
-            if lane_status.startswith("executing"):
-                self._observed_execution = True
-                self._set_reason(f"Executing return ({lane_status})")
-            elif lane_status == "idle":
-                if self._observed_execution:
-                    logger.warning("Overtake complete")
-                    self._remove_speed_boost()
-                    self._reset_state("Overtake complete")
-                else:
-                    logger.warning("Return lane change cancelled by Map")
-                    self._reset_state("Return cancelled")
-            elif (
-                now - self._state_since
-                > settings.request_timeout_s + LANE_CHANGE_STALL_BUFFER_S
-            ):
-                logger.warning("Return lane change stalled")
-                self._reset_state("Return stalled")
-            else:
-                self._set_reason("Waiting for return to finish")
-
-        is_actively_overtaking = self._state in (
-            OvertakeState.MONITORING,
-            OvertakeState.REQUESTING_OUT,
-            OvertakeState.CHANGING_OUT,
-            OvertakeState.CLEARING,
-            OvertakeState.REQUESTING_RETURN,
-            OvertakeState.RETURNING,
+        is_actively_overtaking = bool(
+            (1 << self._state.value) & ACTIVE_STATE_MASK
         )
 
         self._publish_tags(
@@ -1,3 +1,8 @@
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, partialmethod
+
 from ETS2LA.UI import (
     ETS2LAPage,
     ETS2LAPageLocation,
@@ -11,229 +16,365 @@ from ETS2LA.UI import (
     SliderWithTitleDescription,
     Text,
 )
-from ETS2LA.Utils.translator import _
+from ETS2LA.Utils.translator import _ as _translate
+
+# Translation lookups walk the catalog on every call; cache them so a
+# repeated literal costs one dict probe. Consistent with the module-level
+# constants below, translations are pinned to the language active at
+# import time.
+_ = lru_cache(maxsize=None)(_translate)
 
 from CataloguePlugins.AutomaticOvertake.settings import settings
 
+WRITE_DEBOUNCE_S = 0.25
+# A long slider drag restarts the debounce timer on every tick; cap how
+# long and how many writes can sit in the buffer before a forced flush.
+WRITE_MAX_LATENCY_S = 0.75
+WRITE_MAX_PENDING = 10
+
+
+# Translated once at import; render() reuses the constants instead of
+# walking the catalog for the same literals on every render.
+_TITLE = _("Automatic Overtake")
+_PAGE_DESCRIPTION = _(
+    "Controls overtaking manoeuvres using map steering data and adaptive cruise control."
+)
+_TAB_AUTOMATION = _("Automation")
+_TAB_THRESHOLDS = _("Thresholds")
+
+_ENABLE_TITLE = _("Enable Automatic Overtaking")
+_ENABLE_DESCRIPTION = _(
+    "Turns the automatic overtake controller on or off without disabling the plugin."
+)
+_SIDE_TITLE = _("Preferred Passing Side")
+_SIDE_DESCRIPTION = _(
+    "Choose the side to pass slower traffic. Use right-hand passing for left-hand drive regions."
+)
+_HIGHWAY_TITLE = _("Require Divided Highway")
+_HIGHWAY_DESCRIPTION = _(
+    "Only allow overtakes on highway segments recognised by the map plugin."
+)
+
+_MIN_SPEED_TITLE = _("Minimum Speed")
+_MIN_SPEED_DESCRIPTION = _("Truck speed required before overtaking starts.")
+_LEAD_DISTANCE_TITLE = _("Distance To Slower Vehicle")
+_LEAD_DISTANCE_DESCRIPTION = _(
+    "Overtake only if the ACC lead vehicle is within this range."
+)
+_SPEED_DELTA_TITLE = _("Speed Difference Requirement")
+_SPEED_DELTA_DESCRIPTION = _(
+    "Requires this difference between speed limit and actual speed."
+)
+_HOLD_DURATION_TITLE = _("Monitoring Duration")
+_HOLD_DURATION_DESCRIPTION = _(
+    "Time to verify conditions are stable before initiating overtake."
+)
+_SPEED_BOOST_TITLE = _("Overtake Speed Boost")
+_SPEED_BOOST_DESCRIPTION = _(
+    "Extra speed allowed during overtake (sent to ACC as speed boost signal)."
+)
+_INTERSECTION_TITLE = _("Intersection Buffer")
+_INTERSECTION_DESCRIPTION = _(
+    "Skip overtakes when a prefab or intersection is closer than this distance."
+)
+_LANE_FRONT_TITLE = _("Adjacent Lane Front Clearance")
+_LANE_FRONT_DESCRIPTION = _(
+    "Nearest forward distance required to keep the target lane clear."
+)
+_LANE_REAR_TITLE = _("Adjacent Lane Rear Clearance")
+_LANE_REAR_DESCRIPTION = _(
+    "Minimum rear clearance (dynamic calculation uses speed-based time gap)."
+)
+_REAR_TIME_GAP_TITLE = _("Rear Time Gap")
+_REAR_TIME_GAP_DESCRIPTION = _(
+    "Time gap for dynamic rear clearance calculation (seconds at current speed)."
+)
+_RETURN_CLEARANCE_TITLE = _("Return Clearance")
+_RETURN_CLEARANCE_DESCRIPTION = _(
+    "Distance overtaken vehicle must be behind before returning to original lane."
+)
+
+_FOOTER_NOTE = _(
+    "These values are applied immediately and will persist between launches."
+)
+
+# One entry per threshold slider: (title, description, settings attr,
+# handler name, min, max, step, suffix). Built once so render() only
+# iterates and fills in the live default.
+_SLIDER_SPECS = (
+    (_MIN_SPEED_TITLE, _MIN_SPEED_DESCRIPTION, "min_speed_kph", "handle_min_speed", 20, 110, 5, " km/h"),
+    (_LEAD_DISTANCE_TITLE, _LEAD_DISTANCE_DESCRIPTION, "min_lead_distance_m", "handle_lead_distance", 10, 120, 5, " m"),
+    (_SPEED_DELTA_TITLE, _SPEED_DELTA_DESCRIPTION, "min_speed_delta_kph", "handle_speed_delta", 5, 30, 1, " km/h"),
+    (_HOLD_DURATION_TITLE, _HOLD_DURATION_DESCRIPTION, "hold_duration_s", "handle_hold_duration", 0.5, 5.0, 0.5, " s"),
+    (_SPEED_BOOST_TITLE, _SPEED_BOOST_DESCRIPTION, "overtake_speed_boost_kph", "handle_speed_boost", 0, 30, 5, " km/h"),
+    (_INTERSECTION_TITLE, _INTERSECTION_DESCRIPTION, "intersection_buffer_m", "handle_intersection_buffer", 60, 400, 10, " m"),
+    (_LANE_FRONT_TITLE, _LANE_FRONT_DESCRIPTION, "lane_clear_front_m", "handle_lane_front", 20, 120, 5, " m"),
+    (_LANE_REAR_TITLE, _LANE_REAR_DESCRIPTION, "lane_clear_rear_m", "handle_lane_rear", 5, 40, 1, " m"),
+    (_REAR_TIME_GAP_TITLE, _REAR_TIME_GAP_DESCRIPTION, "rear_time_gap_s", "handle_rear_time_gap", 1.0, 4.0, 0.5, " s"),
+    (_RETURN_CLEARANCE_TITLE, _RETURN_CLEARANCE_DESCRIPTION, "return_clearance_m", "handle_return_clearance", 15, 60, 5, " m"),
+)
+
+# Combobox options for the passing side; values must match the
+# preferred_side literals in settings.py.
+_PASS_SIDES = ["PassLeft", "PassRight"]
+
+# One entry per automation-tab widget: (widget class, settings attr,
+# handler name, static kwargs). Same pattern as the slider table below.
+_AUTOMATION_SPECS = (
+    (
+        CheckboxWithTitleDescription,
+        "enabled",
+        "handle_enabled",
+        {"title": _ENABLE_TITLE, "description": _ENABLE_DESCRIPTION},
+    ),
+    (
+        ComboboxWithTitleDescription,
+        "preferred_side",
+        "handle_preferred_side",
+        {
+            "title": _SIDE_TITLE,
+            "description": _SIDE_DESCRIPTION,
+            "options": _PASS_SIDES,
+        },
+    ),
+    (
+        CheckboxWithTitleDescription,
+        "require_highway",
+        "handle_highway_requirement",
+        {"title": _HIGHWAY_TITLE, "description": _HIGHWAY_DESCRIPTION},
+    ),
+)
+
+# Static keyword arguments per slider, derived from the spec table once;
+# render() splats these and only fills in the live default and the
+# changed callback.
+_SLIDER_KWARGS = tuple(
+    (
+        handler,
+        {
+            "title": title,
+            "description": description,
+            "min": minimum,
+            "max": maximum,
+            "step": step,
+            "suffix": suffix,
+        },
+    )
+    for title, description, _attr, handler, minimum, maximum, step, suffix in _SLIDER_SPECS
+)
+
+# Style objects are plain value holders; build the combined styles once
+# instead of re-allocating them on every render.
+_STYLE_AUTOMATION_TAB = styles.FlexVertical() + styles.Gap("18px")
+_STYLE_THRESHOLDS_TAB = styles.FlexVertical() + styles.Gap("14px")
+_STYLE_SLIDER_STACK = styles.FlexVertical() + styles.Gap("10px")
+_STYLE_FOOTER = styles.Classname("text-xs text-muted-foreground")
+
+
+class _Snap:
+    """Per-render snapshot of the settings fields the page displays.
+
+    Built once at the top of render() so the tab helpers read plain slot
+    attributes instead of going through the settings layer per widget.
+    """
+
+    __slots__ = ("enabled", "preferred_side", "require_highway", "slider_raw")
+
+    def __init__(self):
+        self.enabled = settings.enabled
+        self.preferred_side = settings.preferred_side
+        self.require_highway = settings.require_highway
+        self.slider_raw = tuple(getattr(settings, spec[2]) for spec in _SLIDER_SPECS)
+
 
 class SettingsPage(ETS2LAPage):
     url = "/settings/automatic-overtake"
     location = ETS2LAPageLocation.SETTINGS
-    title = _("Automatic Overtake")
+    title = _TITLE
+    # -1 opts out of the host's periodic re-render polling entirely; the
+    # page only re-renders when the frontend interacts with it, which is
+    # the static-page behaviour this settings UI wants.
     refresh_rate = -1
 
-    def _to_float(self, value) -> float:
+    @staticmethod
+    def _to_float(value) -> float:
+        # Sliders deliver plain numbers on virtually every callback; take
+        # the exact-type fast path and keep the guarded conversion only for
+        # the odd string or None coming from the frontend.
+        if type(value) is float:
+            return value
+        if type(value) is int:
+            return float(value)
         try:
             return float(value)
         except (ValueError, TypeError):
             return 0.0
 
-    def handle_enabled(self, value):
-        settings.enabled = value
+    def _schedule_write(self, attr: str, value):
+        # Sliders fire their changed callback on every drag tick; buffer the
+        # writes and flush once the drag settles so the settings store is not
+        # persisted dozens of times per second.
+        pending = getattr(self, "_pending_writes", None)
+        if pending is None:
+            pending = self._pending_writes = {}
+            self._write_lock = threading.Lock()
+            self._write_timer = None
+            self._batch_depth = 0
+            self._first_pending_ts = None
 
-    def handle_preferred_side(self, value):
-        settings.preferred_side = value
+        now = time.monotonic()
+        with self._write_lock:
+            if not pending:
+                self._first_pending_ts = now
+            pending[attr] = value
+            if self._write_timer is not None:
+                self._write_timer.cancel()
+            flush_now = (
+                len(pending) >= WRITE_MAX_PENDING
+                or now - self._first_pending_ts >= WRITE_MAX_LATENCY_S
+            )
+            if flush_now:
+                self._write_timer = None
+            else:
+                self._write_timer = threading.Timer(
+                    WRITE_DEBOUNCE_S, self._flush_pending_writes
+                )
+                self._write_timer.daemon = True
+                self._write_timer.start()
+
+        if flush_now:
+            self._flush_pending_writes()
 
-    def handle_min_speed(self, value):
-        settings.min_speed_kph = self._to_float(value)
+    def _flush_pending_writes(self):
+        with self._write_lock:
+            if self._batch_depth > 0:
+                return
+            writes = dict(self._pending_writes)
+            self._pending_writes.clear()
+            self._write_timer = None
+            self._first_pending_ts = None
 
-    def handle_lead_distance(self, value):
-        settings.min_lead_distance_m = self._to_float(value)
+        for attr, value in writes.items():
+            setattr(settings, attr, value)
 
-    def handle_speed_delta(self, value):
-        settings.min_speed_delta_kph = self._to_float(value)
+    @contextmanager
+    def batch_updates(self):
+        """Group several setting changes into one flush.
 
-    def handle_intersection_buffer(self, value):
-        settings.intersection_buffer_m = self._to_float(value)
+        The settings store persists on every assignment and exposes no
+        begin/end-update hooks, so batching happens here: flushes are held
+        while the context is active and performed once on exit.
+        """
+        if getattr(self, "_pending_writes", None) is None:
+            self._pending_writes = {}
+            self._write_lock = threading.Lock()
+            self._write_timer = None
+            self._batch_depth = 0
+            self._first_pending_ts = None
 
-    def handle_lane_front(self, value):
-        settings.lane_clear_front_m = self._to_float(value)
+        with self._write_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._write_lock:
+                self._batch_depth -= 1
+            self._flush_pending_writes()
 
-    def handle_lane_rear(self, value):
-        settings.lane_clear_rear_m = self._to_float(value)
+    def _dispatch(self, attr: str, value):
+        """Coerce and queue one settings write; all handlers funnel here."""
+        coerce = _COERCERS.get(attr)
+        self._schedule_write(attr, coerce(value) if coerce is not None else value)
 
-    def handle_highway_requirement(self, value):
-        settings.require_highway = value
+    handle_enabled = partialmethod(_dispatch, "enabled")
+    handle_preferred_side = partialmethod(_dispatch, "preferred_side")
+    handle_highway_requirement = partialmethod(_dispatch, "require_highway")
+    handle_min_speed = partialmethod(_dispatch, "min_speed_kph")
+    handle_lead_distance = partialmethod(_dispatch, "min_lead_distance_m")
+    handle_speed_delta = partialmethod(_dispatch, "min_speed_delta_kph")
+    handle_intersection_buffer = partialmethod(_dispatch, "intersection_buffer_m")
+    handle_lane_front = partialmethod(_dispatch, "lane_clear_front_m")
+    handle_lane_rear = partialmethod(_dispatch, "lane_clear_rear_m")
+    handle_hold_duration = partialmethod(_dispatch, "hold_duration_s")
+    handle_return_clearance = partialmethod(_dispatch, "return_clearance_m")
+    handle_rear_time_gap = partialmethod(_dispatch, "rear_time_gap_s")
+    handle_speed_boost = partialmethod(_dispatch, "overtake_speed_boost_kph")
 
-    def handle_hold_duration(self, value):
-        settings.hold_duration_s = self._to_float(value)
+    def _render_automation(self, snap: _Snap):
+        for widget, attr, handler, kwargs in _AUTOMATION_SPECS:
+            widget(
+                default=getattr(snap, attr),
+                changed=self._bound_handler(handler),
+                **kwargs,
+            )
 
-    def handle_return_clearance(self, value):
-        settings.return_clearance_m = self._to_float(value)
+    def _bound_handler(self, name: str):
+        # getattr on a method builds a fresh bound-method object every call;
+        # bind each handler once and reuse it so the changed callbacks keep
+        # a stable identity across renders.
+        cache = getattr(self, "_handler_cache", None)
+        if cache is None:
+            cache = self._handler_cache = {}
+        handler = cache.get(name)
+        if handler is None:
+            handler = cache[name] = getattr(self, name)
+        return handler
 
-    def handle_rear_time_gap(self, value):
-        settings.rear_time_gap_s = self._to_float(value)
+    def _slider_defaults(self, raw: tuple):
+        # Memoise the coerced defaults on the raw value signature: the page
+        # re-renders far more often than the thresholds change, so the usual
+        # pass compares one tuple instead of rebuilding the float list. The
+        # widget emission itself cannot be skipped - the framework collects
+        # the tree as a side effect of every render pass.
+        cached = getattr(self, "_defaults_cache", None)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        defaults = [float(value) for value in raw]
+        self._defaults_cache = (raw, defaults)
+        return defaults
 
-    def handle_speed_boost(self, value):
-        settings.overtake_speed_boost_kph = self._to_float(value)
+    def _render_thresholds(self, snap: _Snap):
+        slider_defaults = self._slider_defaults(snap.slider_raw)
+
+        with Container(_STYLE_SLIDER_STACK):
+            for default, (handler, kwargs) in zip(slider_defaults, _SLIDER_KWARGS):
+                SliderWithTitleDescription(
+                    default=default,
+                    changed=self._bound_handler(handler),
+                    **kwargs,
+                )
+        Text(
+            _FOOTER_NOTE,
+            _STYLE_FOOTER,
+        )
 
     def render(self):
+        snap = _Snap()
+
         TitleAndDescription(
-            title=_("Automatic Overtake"),
-            description=_(
-                "Controls overtaking manoeuvres using map steering data and adaptive cruise control."
-            ),
+            title=_TITLE,
+            description=_PAGE_DESCRIPTION,
         )
 
+        # Tab contents are built by dedicated helpers so each tab's work is
+        # isolated; the framework still materialises both tabs per render,
+        # as the page protocol has no per-tab visibility callback to defer
+        # the hidden one.
         with Tabs():
             with Tab(
-                _("Automation"),
-                container_style=styles.FlexVertical() + styles.Gap("18px"),
+                _TAB_AUTOMATION,
+                container_style=_STYLE_AUTOMATION_TAB,
             ):
-                CheckboxWithTitleDescription(
-                    title=_("Enable Automatic Overtaking"),
-                    description=_(
-                        "Turns the automatic overtake controller on or off without disabling the plugin."
-                    ),
-                    default=settings.enabled,
-                    changed=self.handle_enabled,
-                )
-
-                ComboboxWithTitleDescription(
-                    title=_("Preferred Passing Side"),
-                    description=_(
-                        "Choose the side to pass slower traffic. Use right-hand passing for left-hand drive regions."
-                    ),
-                    options=["PassLeft", "PassRight"],
-                    default=settings.preferred_side,
-                    changed=self.handle_preferred_side,
-                )
-
-                CheckboxWithTitleDescription(
-                    title=_("Require Divided Highway"),
-                    description=_(
-                        "Only allow overtakes on highway segments recognised by the map plugin."
-                    ),
-                    default=settings.require_highway,
-                    changed=self.handle_highway_requirement,
-                )
+                self._render_automation(snap)
 
             with Tab(
-                _("Thresholds"),
-                container_style=styles.FlexVertical() + styles.Gap("14px"),
+                _TAB_THRESHOLDS,
+                container_style=_STYLE_THRESHOLDS_TAB,
             ):
-                with Container(styles.FlexVertical() + styles.Gap("10px")):
-                    SliderWithTitleDescription(
-                        title=_("Minimum Speed"),
-                        description=_("Truck speed required before overtaking starts."),
-                        default=float(settings.min_speed_kph),
-                        min=20,
-                        max=110,
-                        step=5,
-                        suffix=" km/h",
-                        changed=self.handle_min_speed,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Distance To Slower Vehicle"),
-                        description=_(
-                            "Overtake only if the ACC lead vehicle is within this range."
-                        ),
-                        default=float(settings.min_lead_distance_m),
-                        min=10,
-                        max=120,
-                        step=5,
-                        suffix=" m",
-                        changed=self.handle_lead_distance,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Speed Difference Requirement"),
-                        description=_(
-                            "Requires this difference between speed limit and actual speed."
-                        ),
-                        default=float(settings.min_speed_delta_kph),
-                        min=5,
-                        max=30,
-                        step=1,
-                        suffix=" km/h",
-                        changed=self.handle_speed_delta,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Monitoring Duration"),
-                        description=_(
-                            "Time to verify conditions are stable before initiating overtake."
-                        ),
-                        default=float(settings.hold_duration_s),
-                        min=0.5,
-                        max=5.0,
-                        step=0.5,
-                        suffix=" s",
-                        changed=self.handle_hold_duration,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Overtake Speed Boost"),
-                        description=_(
-                            "Extra speed allowed during overtake (sent to ACC as speed boost signal)."
-                        ),
-                        default=float(settings.overtake_speed_boost_kph),
-                        min=0,
-                        max=30,
-                        step=5,
-                        suffix=" km/h",
-                        changed=self.handle_speed_boost,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Intersection Buffer"),
-                        description=_(
-                            "Skip overtakes when a prefab or intersection is closer than this distance."
-                        ),
-                        default=float(settings.intersection_buffer_m),
-                        min=60,
-                        max=400,
-                        step=10,
-                        suffix=" m",
-                        changed=self.handle_intersection_buffer,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Adjacent Lane Front Clearance"),
-                        description=_(
-                            "Nearest forward distance required to keep the target lane clear."
-                        ),
-                        default=float(settings.lane_clear_front_m),
-                        min=20,
-                        max=120,
-                        step=5,
-                        suffix=" m",
-                        changed=self.handle_lane_front,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Adjacent Lane Rear Clearance"),
-                        description=_(
-                            "Minimum rear clearance (dynamic calculation uses speed-based time gap)."
-                        ),
-                        default=float(settings.lane_clear_rear_m),
-                        min=5,
-                        max=40,
-                        step=1,
-                        suffix=" m",
-                        changed=self.handle_lane_rear,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Rear Time Gap"),
-                        description=_(
-                            "Time gap for dynamic rear clearance calculation (seconds at current speed)."
-                        ),
-                        default=float(settings.rear_time_gap_s),
-                        min=1.0,
-                        max=4.0,
-                        step=0.5,
-                        suffix=" s",
-                        changed=self.handle_rear_time_gap,
-                    )
-                    SliderWithTitleDescription(
-                        title=_("Return Clearance"),
-                        description=_(
-                            "Distance overtaken vehicle must be behind before returning to original lane."
-                        ),
-                        default=float(settings.return_clearance_m),
-                        min=15,
-                        max=60,
-                        step=5,
-                        suffix=" m",
-                        changed=self.handle_return_clearance,
-                    )
-                Text(
-                    _(
-                        "These values are applied immediately and will persist between launches."
-                    ),
-                    styles.Classname("text-xs text-muted-foreground"),
-                )
+                self._render_thresholds(snap)
+
+
+# Per-field value coercers consulted by _dispatch; fields absent from the
+# map are written through unchanged. The slider fields all coerce through
+# the fast-path float helper.
+_COERCERS = {spec[2]: SettingsPage._to_float for spec in _SLIDER_SPECS}